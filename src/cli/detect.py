@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import click
+from concurrent.futures import ThreadPoolExecutor
 from src.detector.options import Options
 from src.detector.loader import Loader
 from src.detector.detector import Detector
@@ -81,19 +82,25 @@ def detect(
     # 3. Create protoc command (back up solution) to load the FileDescriptorSet.
     # It takes options, returns fileDescriptorSet.
     if options.use_descriptor_set():
-        file_set_original = Loader(
-            None, None, options.original_descriptor_set_file_path
-        ).get_descriptor_set()
-        file_set_update = Loader(
-            None, None, options.update_descriptor_set_file_path
-        ).get_descriptor_set()
+        loaders = (
+            Loader(None, None, options.original_descriptor_set_file_path),
+            Loader(None, None, options.update_descriptor_set_file_path),
+        )
     elif options.use_proto_dirs():
-        file_set_original = Loader(
-            options.original_api_definition_dirs, options.original_proto_files, None
-        ).get_descriptor_set()
-        file_set_update = Loader(
-            options.update_api_definition_dirs, options.update_proto_files, None
-        ).get_descriptor_set()
+        loaders = (
+            Loader(
+                options.original_api_definition_dirs, options.original_proto_files, None
+            ),
+            Loader(
+                options.update_api_definition_dirs, options.update_proto_files, None
+            ),
+        )
+    # The two versions are loaded independently and the time is mostly spent
+    # waiting on protoc subprocesses, so load them concurrently.
+    with ThreadPoolExecutor(max_workers=len(loaders)) as executor:
+        file_set_original, file_set_update = executor.map(
+            Loader.get_descriptor_set, loaders
+        )
     # 4. Create the detector with two FileDescriptorSet and options.
     # It creates output_json file and prints human-readable message if the option is enabled.
     Detector(file_set_original, file_set_update, options).detect_breaking_changes()
@@ -12,11 +12,39 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
 from src.findings.finding_container import FindingContainer
 from src.findings.utils import FindingCategory, ChangeType
 from src.comparator.wrappers import Field
 
 
+def _comparable_state(field: Field):
+    # The attributes of a field that the comparator checks, packed in a tuple.
+    # Use the raw proto3_optional value since the property raises if the
+    # field is not in a oneof.
+    type_name = field.type_name
+    return (
+        field.name,
+        field.repeated.value,
+        field.required.value,
+        field.proto_type.value,
+        type_name.value if type_name else None,
+        field.oneof,
+        field.field_pb.proto3_optional,
+    )
+
+
+@functools.lru_cache(maxsize=4096)
+def _transform_type_name(api_version_original, api_version_update, type_name):
+    # The same type names and API versions recur for every field in a file set,
+    # so the transformation is cached.
+    return (
+        type_name.replace(api_version_original, api_version_update)
+        if api_version_original
+        else None
+    )
+
+
 class FieldComparator:
     # resource_database: global resource database that contains all file-level resource definitions
     #                    and message-level resource options.
@@ -34,117 +62,125 @@ class FieldComparator:
         self.finding_container = finding_container
 
     def compare(self):
+        field_original = self.field_original
+        field_update = self.field_update
+        finding_container = self.finding_container
         # 1. If original FieldDescriptor is None, then a
         # new FieldDescriptor is added.
-        if self.field_original is None:
-            self.finding_container.addFinding(
+        if field_original is None:
+            finding_container.addFinding(
                 category=FindingCategory.FIELD_ADDITION,
-                proto_file_name=self.field_update.proto_file_name,
-                source_code_line=self.field_update.source_code_line,
-                message=f"A new field `{self.field_update.name}` is added.",
+                proto_file_name=field_update.proto_file_name,
+                source_code_line=field_update.source_code_line,
+                message=f"A new field `{field_update.name}` is added.",
                 change_type=ChangeType.MINOR,
             )
             return
 
         # 2. If updated FieldDescriptor is None, then
         # the original FieldDescriptor is removed.
-        if self.field_update is None:
-            self.finding_container.addFinding(
+        if field_update is None:
+            finding_container.addFinding(
                 category=FindingCategory.FIELD_REMOVAL,
-                proto_file_name=self.field_original.proto_file_name,
-                source_code_line=self.field_original.source_code_line,
-                message=f"An existing field `{self.field_original.name}` is removed.",
+                proto_file_name=field_original.proto_file_name,
+                source_code_line=field_original.source_code_line,
+                message=f"An existing field `{field_original.name}` is removed.",
                 change_type=ChangeType.MAJOR,
             )
             return
 
+        # Most fields are identical in both versions, skip the checks
+        # below if nothing differs.
+        if self._fields_identical():
+            return
+
         # 3. If both FieldDescriptors are existing, check
         # if the name is changed.
-        if self.field_original.name != self.field_update.name:
-            self.finding_container.addFinding(
+        if field_original.name != field_update.name:
+            finding_container.addFinding(
                 category=FindingCategory.FIELD_NAME_CHANGE,
-                proto_file_name=self.field_update.proto_file_name,
-                source_code_line=self.field_update.source_code_line,
-                message=f"Name of an existing field is changed from `{self.field_original.name}` to `{self.field_update.name}`.",
+                proto_file_name=field_update.proto_file_name,
+                source_code_line=field_update.source_code_line,
+                message=f"Name of an existing field is changed from `{field_original.name}` to `{field_update.name}`.",
                 change_type=ChangeType.MAJOR,
             )
             return
 
         # 4. If the FieldDescriptors have the same name, check if the
         # repeated state of them stay the same.
-        if self.field_original.repeated.value != self.field_update.repeated.value:
-            self.finding_container.addFinding(
+        if field_original.repeated.value != field_update.repeated.value:
+            finding_container.addFinding(
                 category=FindingCategory.FIELD_REPEATED_CHANGE,
-                proto_file_name=self.field_update.proto_file_name,
-                source_code_line=self.field_update.repeated.source_code_line,
-                message=f"Repeated state of an existing field `{self.field_original.name}` is changed.",
+                proto_file_name=field_update.proto_file_name,
+                source_code_line=field_update.repeated.source_code_line,
+                message=f"Repeated state of an existing field `{field_original.name}` is changed.",
                 change_type=ChangeType.MAJOR,
             )
         # Field option change from optional to required is breaking.
-        if not self.field_original.required.value and self.field_update.required.value:
-            self.finding_container.addFinding(
+        if not field_original.required.value and field_update.required.value:
+            finding_container.addFinding(
                 category=FindingCategory.FIELD_BEHAVIOR_CHANGE,
-                proto_file_name=self.field_update.proto_file_name,
-                source_code_line=self.field_update.required.source_code_line,
-                message=f"Field behavior of an existing field `{self.field_original.name}` is changed.",
+                proto_file_name=field_update.proto_file_name,
+                source_code_line=field_update.required.source_code_line,
+                message=f"Field behavior of an existing field `{field_original.name}` is changed.",
                 change_type=ChangeType.MAJOR,
             )
         # 5. Check the type of the field.
-        if self.field_original.proto_type.value != self.field_update.proto_type.value:
-            self.finding_container.addFinding(
+        if field_original.proto_type.value != field_update.proto_type.value:
+            finding_container.addFinding(
                 category=FindingCategory.FIELD_TYPE_CHANGE,
-                proto_file_name=self.field_update.proto_file_name,
-                source_code_line=self.field_update.proto_type.source_code_line,
-                message=f"Type of an existing field `{self.field_original.name}` is changed from `{self.field_original.proto_type.value}` to `{self.field_update.proto_type.value}`.",
+                proto_file_name=field_update.proto_file_name,
+                source_code_line=field_update.proto_type.source_code_line,
+                message=f"Type of an existing field `{field_original.name}` is changed from `{field_original.proto_type.value}` to `{field_update.proto_type.value}`.",
                 change_type=ChangeType.MAJOR,
             )
         # If field has the same primitive type, then the type should be identical.
         # If field has the same non-primitive type like `TYPE_ENUM`.
         # Check the type_name of the field.
-        elif self.field_original.type_name and (
-            self.field_original.type_name.value != self.field_update.type_name.value
+        elif field_original.type_name and (
+            field_original.type_name.value != field_update.type_name.value
         ):
             # Version update is allowed here, for example from `.example.v1.Enum` to `.example.v1beta1.Enum`.
             # But from `.example.v1.Enum` to `.example.v2.EnumUpdate` is breaking.
             transformed_type_name = self._transformed_type_name(
-                self.field_original.type_name.value
+                field_original.type_name.value
             )
             if (
                 not transformed_type_name
-                or transformed_type_name != self.field_update.type_name.value
+                or transformed_type_name != field_update.type_name.value
             ):
-                self.finding_container.addFinding(
+                finding_container.addFinding(
                     category=FindingCategory.FIELD_TYPE_CHANGE,
-                    proto_file_name=self.field_update.proto_file_name,
-                    source_code_line=self.field_update.type_name.source_code_line,
-                    message=f"Type of an existing field `{self.field_original.name}` is changed from `{self.field_original.type_name.value}` to `{self.field_update.type_name.value}`.",
+                    proto_file_name=field_update.proto_file_name,
+                    source_code_line=field_update.type_name.source_code_line,
+                    message=f"Type of an existing field `{field_original.name}` is changed from `{field_original.type_name.value}` to `{field_update.type_name.value}`.",
                     change_type=ChangeType.MAJOR,
                 )
         # If the fields have the same type_name, but they are map type,
         # the key type and value type should also be identical.
-        elif self.field_original.type_name:
-            if self.field_original.is_map_type and not self.field_update.is_map_type:
-                self.finding_container.addFinding(
+        elif field_original.type_name:
+            if field_original.is_map_type and not field_update.is_map_type:
+                finding_container.addFinding(
                     category=FindingCategory.FIELD_TYPE_CHANGE,
-                    proto_file_name=self.field_update.proto_file_name,
-                    source_code_line=self.field_update.type_name.source_code_line,
-                    message=f"Type of an existing field `{self.field_original.name}` is changed from a map to `{self.field_update.type_name.value}`.",
+                    proto_file_name=field_update.proto_file_name,
+                    source_code_line=field_update.type_name.source_code_line,
+                    message=f"Type of an existing field `{field_original.name}` is changed from a map to `{field_update.type_name.value}`.",
                     change_type=ChangeType.MAJOR,
                 )
-            elif not self.field_original.is_map_type and self.field_update.is_map_type:
-                self.finding_container.addFinding(
+            elif not field_original.is_map_type and field_update.is_map_type:
+                finding_container.addFinding(
                     category=FindingCategory.FIELD_TYPE_CHANGE,
-                    proto_file_name=self.field_update.proto_file_name,
-                    source_code_line=self.field_update.type_name.source_code_line,
-                    message=f"Type of an existing field `{self.field_original.name}` is changed from `{self.field_original.type_name.value}` to a map.",
+                    proto_file_name=field_update.proto_file_name,
+                    source_code_line=field_update.type_name.source_code_line,
+                    message=f"Type of an existing field `{field_original.name}` is changed from `{field_original.type_name.value}` to a map.",
                     change_type=ChangeType.MAJOR,
                 )
             # Both fields are map types, compare the key and value type.
-            elif self.field_original.is_map_type and self.field_update.is_map_type:
-                key_original = self.field_original.map_entry_type["key"]
-                value_original = self.field_original.map_entry_type["value"]
-                key_update = self.field_update.map_entry_type["key"]
-                value_update = self.field_update.map_entry_type["value"]
+            elif field_original.is_map_type and field_update.is_map_type:
+                key_original = field_original.map_entry_type["key"]
+                value_original = field_original.map_entry_type["value"]
+                key_update = field_update.map_entry_type["key"]
+                value_update = field_update.map_entry_type["value"]
                 # If either the key, value is not primitive type, then it should allow
                 # minor version updates.
                 identical_key_type = (
@@ -156,21 +192,23 @@ class FieldComparator:
                     or self._transformed_type_name(value_original) == value_update
                 )
                 if not (identical_key_type and identical_value_type):
-                    self.finding_container.addFinding(
+                    finding_container.addFinding(
                         category=FindingCategory.FIELD_TYPE_CHANGE,
-                        proto_file_name=self.field_update.proto_file_name,
-                        source_code_line=self.field_update.type_name.source_code_line,
-                        message=f"Type of an existing field `{self.field_original.name}` is changed from `map<{key_original}, {value_original}>` to `map<{key_update}, {value_update}>`.",
+                        proto_file_name=field_update.proto_file_name,
+                        source_code_line=field_update.type_name.source_code_line,
+                        message=f"Type of an existing field `{field_original.name}` is changed from `map<{key_original}, {value_original}>` to `map<{key_update}, {value_update}>`.",
                         change_type=ChangeType.MAJOR,
                     )
 
         # 6. Check the oneof state of the field.
-        if self.field_original.oneof != self.field_update.oneof:
-            proto_file_name = self.field_update.proto_file_name
-            source_code_line = self.field_update.source_code_line
-            if self.field_original.oneof:
-                msg = f"An existing field `{self.field_original.name}` is moved out of One-of."
-                self.finding_container.addFinding(
+        if field_original.oneof != field_update.oneof:
+            proto_file_name = field_update.proto_file_name
+            source_code_line = field_update.source_code_line
+            if field_original.oneof:
+                msg = (
+                    f"An existing field `{field_original.name}` is moved out of One-of."
+                )
+                finding_container.addFinding(
                     category=FindingCategory.FIELD_ONEOF_REMOVAL,
                     proto_file_name=proto_file_name,
                     source_code_line=source_code_line,
@@ -178,8 +216,8 @@ class FieldComparator:
                     change_type=ChangeType.MAJOR,
                 )
             else:
-                msg = f"An existing field `{self.field_original.name}` is moved into One-of."
-                self.finding_container.addFinding(
+                msg = f"An existing field `{field_original.name}` is moved into One-of."
+                finding_container.addFinding(
                     category=FindingCategory.FIELD_ONEOF_ADDITION,
                     proto_file_name=proto_file_name,
                     source_code_line=source_code_line,
@@ -188,32 +226,44 @@ class FieldComparator:
                 )
         # 7. Check the proto3_optional state of the field.
         elif (
-            self.field_original.oneof
-            and self.field_original.proto3_optional != self.field_update.proto3_optional
+            field_original.oneof
+            and field_original.proto3_optional != field_update.proto3_optional
         ):
-            if self.field_original.proto3_optional:
-                self.finding_container.addFinding(
+            if field_original.proto3_optional:
+                finding_container.addFinding(
                     category=FindingCategory.FIELD_PROTO3_OPTIONAL_CHANGE,
-                    proto_file_name=self.field_update.proto_file_name,
-                    source_code_line=self.field_update.source_code_line,
-                    message=f"Proto3 optional state of an existing field `{self.field_original.name}` is changed to required.",
+                    proto_file_name=field_update.proto_file_name,
+                    source_code_line=field_update.source_code_line,
+                    message=f"Proto3 optional state of an existing field `{field_original.name}` is changed to required.",
                     change_type=ChangeType.MAJOR,
                 )
-            if self.field_update.proto3_optional:
-                self.finding_container.addFinding(
+            if field_update.proto3_optional:
+                finding_container.addFinding(
                     category=FindingCategory.FIELD_PROTO3_OPTIONAL_CHANGE,
-                    proto_file_name=self.field_update.proto_file_name,
-                    source_code_line=self.field_update.source_code_line,
-                    message=f"An existing field `{self.field_original.name}` is changed to proto3 optional.",
+                    proto_file_name=field_update.proto_file_name,
+                    source_code_line=field_update.source_code_line,
+                    message=f"An existing field `{field_original.name}` is changed to proto3 optional.",
                     change_type=ChangeType.MINOR,
                 )
 
         # 8. Check `google.api.resource_reference` annotation.
         self._compare_resource_reference()
 
+    def _fields_identical(self) -> bool:
+        # Compare everything the checks in `compare` look at in one go.
+        # Map fields and resource references need the detailed comparison.
+        field_original = self.field_original
+        field_update = self.field_update
+        if field_original.is_map_type or field_update.is_map_type:
+            return False
+        if field_original.resource_reference or field_update.resource_reference:
+            return False
+        return _comparable_state(field_original) == _comparable_state(field_update)
+
     def _compare_resource_reference(self):
         field_original = self.field_original
         field_update = self.field_update
+        finding_container = self.finding_container
         resource_ref_original = field_original.resource_reference
         resource_ref_update = field_update.resource_reference
         # No resource_reference annotations found for the field in both versions.
@@ -225,7 +275,7 @@ class FieldComparator:
             resource_in_database = self._resource_in_database(resource_ref_update)
             # If the new resource reference is not in the database, breaking change.
             if not resource_in_database:
-                self.finding_container.addFinding(
+                finding_container.addFinding(
                     category=FindingCategory.RESOURCE_REFERENCE_ADDITION,
                     proto_file_name=field_update.proto_file_name,
                     source_code_line=resource_ref_update.source_code_line,
@@ -234,7 +284,7 @@ class FieldComparator:
                 )
             # If the new resource reference is in the database, no breaking change.
             else:
-                self.finding_container.addFinding(
+                finding_container.addFinding(
                     category=FindingCategory.RESOURCE_REFERENCE_ADDITION,
                     proto_file_name=field_update.proto_file_name,
                     source_code_line=resource_ref_update.source_code_line,
@@ -245,7 +295,7 @@ class FieldComparator:
         # Resource annotation is removed, check if it is added as a message resource.
         if resource_ref_original and not resource_ref_update:
             if not self._resource_ref_in_local(resource_ref_original.value):
-                self.finding_container.addFinding(
+                finding_container.addFinding(
                     category=FindingCategory.RESOURCE_REFERENCE_REMOVAL,
                     proto_file_name=field_original.proto_file_name,
                     source_code_line=resource_ref_original.source_code_line,
@@ -253,7 +303,7 @@ class FieldComparator:
                     change_type=ChangeType.MAJOR,
                 )
             else:
-                self.finding_container.addFinding(
+                finding_container.addFinding(
                     category=FindingCategory.RESOURCE_REFERENCE_REMOVAL,
                     proto_file_name=field_original.proto_file_name,
                     source_code_line=resource_ref_original.source_code_line,
@@ -272,7 +322,7 @@ class FieldComparator:
                 resource_ref_update.value.type or resource_ref_update.value.child_type
             )
             if original_type != update_type:
-                self.finding_container.addFinding(
+                finding_container.addFinding(
                     category=FindingCategory.RESOURCE_REFERENCE_CHANGE,
                     proto_file_name=field_update.proto_file_name,
                     source_code_line=resource_ref_update.source_code_line,
@@ -304,14 +354,9 @@ class FieldComparator:
         # Tranform type name to allow minor version update.
         # For example from `.example.v1.Enum` to `.example.v1beta1.Enum`.
         # But from `.example.v1.Enum` to `.example.v2.EnumUpdate` is breaking.
-        api_version_original = self.field_original.api_version
-        api_version_update = self.field_update.api_version
-        transformed_type_name = (
-            type_name.replace(api_version_original, api_version_update)
-            if api_version_original
-            else None
+        return _transform_type_name(
+            self.field_original.api_version, self.field_update.api_version, type_name
         )
-        return transformed_type_name
 
     def _resource_in_database(self, resource_ref) -> bool:
         # Check whether the added resource reference is in the database.
@@ -319,7 +364,7 @@ class FieldComparator:
         if not rb_update:
             return False
         resources = (
-            rb_update.get_parent_resource_by_child_type(resource_ref.value.child_type)
+            rb_update.get_parent_resources_by_child_type(resource_ref.value.child_type)
             if self.field_update.child_type
             else rb_update.get_resource_by_type(resource_ref.value.type)
         )
@@ -23,6 +23,10 @@ class ResourceDatabase:
     def __init__(self):
         self.types = {}
         self.patterns = {}
+        # Parent resources already resolved for a child_type. The same child_type
+        # is queried for many fields, so the results are kept until a new
+        # resource is registered.
+        self._parent_resources = {}
 
     def register_resource(self, resource_with_location):
         """ Register a resource in the database. """
@@ -37,6 +41,7 @@ class ResourceDatabase:
         self.patterns.update(
             (pattern, resource_with_location) for pattern in resource_message.pattern
         )
+        self._parent_resources.clear()
 
     def get_resource_by_type(self, resource_type):
         """ Query the resource by type. Return None if the resource is not existing. """
@@ -44,9 +49,15 @@ class ResourceDatabase:
 
     def get_parent_resources_by_child_type(self, child_type):
         """Query the resources by child_type. Return [] if the parent resource is not existing."""
-        result = []
         if not child_type:
-            return result
+            return []
+        if child_type not in self._parent_resources:
+            self._parent_resources[child_type] = self._find_parent_resources(child_type)
+        # Return a copy so that callers cannot modify the cached result.
+        return list(self._parent_resources[child_type])
+
+    def _find_parent_resources(self, child_type):
+        result = []
         child_resource = self.get_resource_by_type(child_type)
         # The child_type is not existing in the database.
         if (
@@ -33,6 +33,9 @@ from google.protobuf.descriptor_pb2 import FieldDescriptorProto
 from src.comparator.resource_database import ResourceDatabase
 from typing import Dict, Sequence, Optional, Tuple, cast
 
+# Matches the API version in a package name, e.g. `v1`, `v1p1beta1` or `v2alpha`.
+_API_VERSION_PATTERN = re.compile(r"v[0-9]+(p[0-9]+)?((alpha|beta)[0-9]*)?")
+
 
 def _get_source_code_line(source_code_locations, path):
     if path not in source_code_locations:
@@ -833,8 +836,7 @@ class FileSet:
         # Get the root package from the API definition files.
         self.root_package = self._get_root_package()
         # Get API version from definition files.
-        version = r"(?P<version>v[0-9]+(p[0-9]+)?((alpha|beta)[0-9]*)?)"
-        search_version = re.search(version, self.root_package)
+        search_version = _API_VERSION_PATTERN.search(self.root_package)
         self.api_version = search_version.group() if search_version else None
         # Get API definition files. This helps us to compare only the definition files
         # and imported dependency information.
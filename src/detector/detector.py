@@ -43,9 +43,10 @@ class Detector:
             self.finding_container,
         ).compare()
         # Output json file of findings and human-readable messages if the
-        # command line option is enabled.
+        # command line option is enabled. `json.dumps` encodes in one shot
+        # with the C encoder, where `json.dump` streams chunks in pure Python.
         with open(self.opts.output_json_path, "w") as write_json_file:
-            json.dump(self.finding_container.toDictArr(), write_json_file)
+            write_json_file.write(json.dumps(self.finding_container.toDictArr()))
 
         if self.opts.human_readable_message:
             sys.stdout.write(self.finding_container.toHumanReadableMessage())
@@ -35,10 +35,18 @@ class Loader:
         proto_defintion_dirs: Sequence[str],
         proto_files: Sequence[str],
         descriptor_set: str,
+        include_source_info: bool = True,
+        include_imports: bool = True,
     ):
         self.proto_defintion_dirs = proto_defintion_dirs
         self.descriptor_set = descriptor_set
         self.proto_files = proto_files
+        # Source info is needed for the line numbers in the findings. Callers that
+        # only need the definitions can turn it off for a much smaller descriptor set.
+        self.include_source_info = include_source_info
+        # The imported dependencies are needed to resolve referenced messages and
+        # resources. Callers that only compare self-contained files can skip them.
+        self.include_imports = include_imports
 
     def get_descriptor_set(self) -> desc.FileDescriptorSet:
         desc_set = desc.FileDescriptorSet()
@@ -49,15 +57,18 @@ class Loader:
                 desc_set.ParseFromString(f.read())
             return desc_set
         # Construct the protoc command with proper argument prefix.
-        protoc_command = [self.PROTOC_BINARY]
-        for directory in self.proto_defintion_dirs:
-            protoc_command.append(f"--proto_path={directory}")
-        protoc_command.append(f"--proto_path={self.PROTOBUF_PROTOS_DIR}")
-        protoc_command.append("-o/dev/stdout")
-        protoc_command.append("--include_source_info")
+        protoc_command = [
+            self.PROTOC_BINARY,
+            *(f"--proto_path={directory}" for directory in self.proto_defintion_dirs),
+            f"--proto_path={self.PROTOBUF_PROTOS_DIR}",
+            "-o/dev/stdout",
+        ]
+        if self.include_source_info:
+            protoc_command.append("--include_source_info")
         # Include the imported dependencies.
-        protoc_command.append("--include_imports")
-        protoc_command.extend(pf for pf in self.proto_files)
+        if self.include_imports:
+            protoc_command.append("--include_imports")
+        protoc_command.extend(self.proto_files)
 
         # Run protoc command to get pb file that contains serialized data of
         # the proto files.
@@ -54,7 +54,7 @@ class FindingContainer:
         return [finding.toDict() for finding in self.finding_results]
 
     def toHumanReadableMessage(self):
-        output_message = ""
+        output_lines = []
         file_to_findings = defaultdict(list)
         for finding in self.getActionableFindings():
             # Create a map to summarize the findings based on proto file name.s
@@ -71,6 +71,8 @@ class FindingContainer:
                     f.message,
                 )
             )
-            for finding in findings:
-                output_message += f"{file_name} L{finding.location.source_code_line}: {finding.message}\n"
-        return output_message
+            output_lines.extend(
+                f"{file_name} L{finding.location.source_code_line}: {finding.message}\n"
+                for finding in findings
+            )
+        return "".join(output_lines)
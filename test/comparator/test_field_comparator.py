@@ -45,6 +45,34 @@ class FieldComparatorTest(unittest.TestCase):
         self.assertEqual(finding.message, "A new field `Foo` is added.")
         self.assertEqual(finding.category.name, "FIELD_ADDITION")
 
+    def test_identical_fields(self):
+        field_foo = make_field("Foo")
+        field_foo_update = make_field("Foo")
+        FieldComparator(field_foo, field_foo_update, self.finding_container).compare()
+        findings = self.finding_container.getAllFindings()
+        self.assertFalse(findings)
+
+    def test_identical_proto3_optional_fields_outside_oneof(self):
+        # The proto3_optional property raises if the field is not in a oneof,
+        # so comparing such a field to itself must not touch it.
+        field_optional = make_field(name="Foo", proto3_optional=True)
+        FieldComparator(
+            field_optional, field_optional, self.finding_container
+        ).compare()
+        findings = self.finding_container.getAllFindings()
+        self.assertFalse(findings)
+
+    def test_fields_differ_only_in_type_name(self):
+        field_foo = make_field(name="Foo", type_name=".example.v1.Foo")
+        field_bar = make_field(name="Foo", type_name=".example.v1.Bar")
+        FieldComparator(field_foo, field_bar, self.finding_container).compare()
+        finding = self.finding_container.getAllFindings()[0]
+        self.assertEqual(
+            finding.message,
+            "Type of an existing field `Foo` is changed from `.example.v1.Foo` to `.example.v1.Bar`.",
+        )
+        self.assertEqual(finding.category.name, "FIELD_TYPE_CHANGE")
+
     def test_name_change(self):
         field_foo = make_field("Foo")
         field_bar = make_field("Bar")
@@ -321,6 +349,37 @@ class FieldComparatorTest(unittest.TestCase):
         self.assertEqual(finding.category.name, "RESOURCE_REFERENCE_ADDITION")
         self.assertEqual(finding.change_type.name, "MINOR")
 
+    def test_resource_reference_addition_child_type_non_breaking(self):
+        # The added resource reference uses `child_type`, and the parent
+        # resource is in the database. Non-breaking change.
+        field_without_reference = make_field(name="Test")
+        # Create a database with parent resource `example.v1/Foo` and
+        # child resource `example.v1/Bar` registered.
+        parent_resource = make_resource_descriptor(
+            resource_type="example.v1/Foo", resource_patterns=["foo/{foo}"]
+        )
+        child_resource = make_resource_descriptor(
+            resource_type="example.v1/Bar", resource_patterns=["foo/{foo}/bar/{bar}"]
+        )
+        resource_database = make_resource_database(
+            resources=[parent_resource, child_resource]
+        )
+        field_options = make_field_annotation_resource_reference(
+            resource_type="example.v1/Bar", is_child_type=True
+        )
+        field_with_reference = make_field(
+            name="Test", options=field_options, resource_database=resource_database
+        )
+        FieldComparator(
+            field_without_reference, field_with_reference, self.finding_container
+        ).compare()
+        finding = self.finding_container.getAllFindings()[0]
+        self.assertEqual(
+            finding.message, "A resource reference option is added to the field `Test`."
+        )
+        self.assertEqual(finding.category.name, "RESOURCE_REFERENCE_ADDITION")
+        self.assertEqual(finding.change_type.name, "MINOR")
+
     def test_resource_reference_removal_breaking1(self):
         # Removed resource reference is not added in message options. Breaking.
         # Original field has resource reference `example.v1/Foo`.
@@ -99,6 +99,40 @@ class ResourceDatabaseTest(unittest.TestCase):
             self.resource_database.get_parent_resources_by_child_type("parent"),
         )
 
+    def test_get_parent_resource_after_registration(self):
+        child_resource = make_resource_descriptor(
+            resource_type="child", resource_patterns=["a/{a}/b/{b}"]
+        )
+        parent_resource = make_resource_descriptor(
+            resource_type="parent", resource_patterns=["a/{a}"]
+        )
+        self.resource_database.register_resource(child_resource)
+        self.assertEqual(
+            self.resource_database.get_parent_resources_by_child_type("child"), []
+        )
+        # Registering the parent resource later should be reflected in the query.
+        self.resource_database.register_resource(parent_resource)
+        self.assertEqual(
+            self.resource_database.get_parent_resources_by_child_type("child"),
+            [parent_resource],
+        )
+
+    def test_get_parent_resource_returns_copy(self):
+        child_resource = make_resource_descriptor(
+            resource_type="child", resource_patterns=["a/{a}/b/{b}"]
+        )
+        parent_resource = make_resource_descriptor(
+            resource_type="parent", resource_patterns=["a/{a}"]
+        )
+        self.resource_database.register_resource(child_resource)
+        self.resource_database.register_resource(parent_resource)
+        # Modifying the result should not affect later queries.
+        self.resource_database.get_parent_resources_by_child_type("child").clear()
+        self.assertEqual(
+            self.resource_database.get_parent_resources_by_child_type("child"),
+            [parent_resource],
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
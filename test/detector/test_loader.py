@@ -14,6 +14,8 @@
 
 import unittest
 import os
+import subprocess
+from unittest import mock
 from src.detector.loader import Loader
 from google.protobuf import descriptor_pb2
 
@@ -56,6 +58,39 @@ class LoaderTest(unittest.TestCase):
             loader.get_descriptor_set(), descriptor_pb2.FileDescriptorSet
         )
 
+    def _make_proto_dirs_loader(self, **kwargs):
+        return Loader(
+            proto_defintion_dirs=[
+                os.path.join(self._CURRENT_DIR, "test/testdata/protos/example/"),
+                self.COMMON_PROTOS_DIR,
+            ],
+            proto_files=[
+                os.path.join(
+                    self._CURRENT_DIR, "test/testdata/protos/example/wrappers.proto"
+                )
+            ],
+            descriptor_set=None,
+            **kwargs,
+        )
+
+    def test_loader_without_source_info(self):
+        loader = self._make_proto_dirs_loader(include_source_info=False)
+        with mock.patch("subprocess.run", wraps=subprocess.run) as mocked_run:
+            desc_set = loader.get_descriptor_set()
+            protoc_command = mocked_run.call_args[0][0]
+        self.assertNotIn("--include_source_info", protoc_command)
+        self.assertFalse(any(f.source_code_info.location for f in desc_set.file))
+
+    def test_loader_without_imports(self):
+        loader = self._make_proto_dirs_loader(include_imports=False)
+        with mock.patch("subprocess.run", wraps=subprocess.run) as mocked_run:
+            desc_set = loader.get_descriptor_set()
+            protoc_command = mocked_run.call_args[0][0]
+        self.assertNotIn("--include_imports", protoc_command)
+        self.assertIn("--include_source_info", protoc_command)
+        # Only the requested file is in the set, without its dependencies.
+        self.assertEqual(len(desc_set.file), 1)
+
     def test_loader_descriptor_set(self):
         loader = Loader(
             proto_defintion_dirs=None,